@@ -2,13 +2,20 @@
 
 import time
 import sys
+import re
+import functools
+import multiprocessing.util
 import urllib.parse
 import os
 import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import validators
-from bs4 import BeautifulSoup, Comment, Doctype
+import requests
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -16,6 +23,77 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.opera.options import Options as OperaOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
 
+# matches css color values in the rgb and rgba format, e.g. "rgb(0, 0, 0)" or "rgba(0, 0, 0, 0.5)"
+RGBA_PATTERN = re.compile(r"rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)(?:\s*,\s*([\d.]+))?\s*\)")
+
+# matches css font sizes in pixels, e.g. "14px" or "14.5px"
+PIXEL_PATTERN = re.compile(r"(\d+(?:\.\d+)?)px")
+
+# font weights that count as bold text
+BOLD_FONT_WEIGHTS = {"bold", "700", "800", "900"}
+
+# parser for the page source of the webdriver, which is always utf-8 after encoding it regardless of the declared charset
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# script that returns the display, color, background color, font size and font weight for each of the given xpaths,
+# the background color is taken from the first element up the tree that is not fully transparent and is remembered
+# for every element on the way, so that texts with the same parents do not walk up the tree again
+COMPUTED_STYLES_SCRIPT = """
+    var backgroundColors = new Map();
+
+    function getBackgroundColor(element) {
+        var visitedElements = [];
+        var backgroundColor = "rgba(255, 255, 255, 1)";
+        for (; element !== null; element = element.parentElement) {
+            if (backgroundColors.has(element)) {
+                backgroundColor = backgroundColors.get(element);
+                break;
+            }
+            visitedElements.push(element);
+            var elementBackgroundColor = window.getComputedStyle(element).backgroundColor;
+            if (elementBackgroundColor !== "transparent" && !/^rgba\\((?:[^,]*,){3}\\s*0\\s*\\)$/.test(elementBackgroundColor)) {
+                backgroundColor = elementBackgroundColor;
+                break;
+            }
+        }
+        visitedElements.forEach(function (visitedElement) {
+            backgroundColors.set(visitedElement, backgroundColor);
+        });
+        return backgroundColor;
+    }
+
+    return arguments[0].map(function (xpath) {
+        var element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (element === null) {
+            return null;
+        }
+        var style = window.getComputedStyle(element);
+        return [style.display, style.color, getBackgroundColor(element), style.fontSize, style.fontWeight];
+    });
+"""
+
+# script that returns the full url of every link on the page and whether the link is visible,
+# the url is resolved from the attribute because the href property of links inside svg elements is not a string
+LINKS_SCRIPT = """
+    var links = [];
+    Array.from(document.getElementsByTagName("a")).forEach(function (link) {
+        var href = link.getAttribute("href");
+        if (href === null) {
+            href = link.getAttributeNS("http://www.w3.org/1999/xlink", "href");
+        }
+        if (href === null) {
+            return;
+        }
+        try {
+            href = new URL(href, document.baseURI).href;
+        } catch (error) {
+            return;
+        }
+        links.push([href, link.getClientRects().length > 0 && window.getComputedStyle(link).visibility !== "hidden"]);
+    });
+    return links;
+"""
+
 class AccessibilityTester:
     """
     An instance of the Accessibility Tester
@@ -38,10 +116,18 @@ class AccessibilityTester:
         The width of the browser window
     follow : bool
         Defines if the test should also test subpages that are linked on the main page
+    workers : int
+        The number of webdrivers that test subpages in parallel
+    static : bool
+        Defines if the pages should be downloaded without a webdriver, which skips the color contrast check
     """
+    # categories of the checks in the order in which they are reported
+    CATEGORIES = ("doc_language", "alt_texts", "input_labels", "empty_buttons", "empty_links", "color_contrast")
+
     def __init__(self, url, required_degree=0, chosen_driver="chrome", headless=True,
-            screenshots=False, browser_height=1080, browser_width=1920, follow=False):
+            screenshots=False, browser_height=1080, browser_width=1920, follow=False, workers=1, static=False):
         self.url = url
+        self.hostname = urllib.parse.urlsplit(url).hostname
         self.required_degree = required_degree
         self.chosen_driver = chosen_driver
         self.headless = headless
@@ -49,16 +135,37 @@ class AccessibilityTester:
         self.browser_height = browser_height
         self.browser_width = browser_width
         self.follow = follow
+        self.workers = workers
+        self.static = static
         self.driver = None
+        self.response = None
+        self.current_url = None
         self.page = None
-        self.correct = {"doc_language":0, "alt_texts":0, "input_labels":0, "empty_buttons":0, "empty_links":0, "color_contrast":0}
-        self.wrong = {"doc_language":0, "alt_texts":0, "input_labels":0, "empty_buttons":0, "empty_links":0, "color_contrast":0}
+        self.indexed_page = None
+        self.elements_by_tag = defaultdict(list)
+        self.elements_by_id = {}
+        self.texts = []
+        self.correct = Counter()
+        self.wrong = Counter()
 
-        self.visited_links = []
+        self.output = []
+        self.visited_links = set()
 
 
     def start_driver(self):
-        """This function starts the webdriver with the set configuration of the instance"""
+        """This function starts the webdriver with the set configuration of the instance and opens the url. In static mode no webdriver is started"""
+        if not self.static:
+            self.create_driver()
+        self.open_page(self.url)
+        self.parse_page()
+
+        # make sure that the screenshots directory exists when screenshots are enabled
+        if self.screenshots:
+            Path("./screenshots").mkdir(parents=True, exist_ok=True)
+
+
+    def create_driver(self):
+        """This function creates the webdriver with the set configuration of the instance"""
         if self.chosen_driver == "chrome":
             options = ChromeOptions()
             options.headless = self.headless
@@ -95,229 +202,392 @@ class AccessibilityTester:
             raise Exception("Webdriver must be one of: Chrome, Firefox, Edge, Opera, Safari")
 
         self.driver.set_window_size(self.browser_width, self.browser_height)
-        self.driver.get(self.url)
-        self.page = BeautifulSoup(self.driver.page_source, "html.parser")
 
-        # make sure that the screenshots directory exists when screenshots are enabled
-        if self.screenshots:
-            Path("./screenshots").mkdir(parents=True, exist_ok=True)
+
+    def open_page(self, url):
+        """This function opens the url in the webdriver or, in static mode, requests the page. The body of the page is only downloaded when it is parsed"""
+        if self.static:
+            self.response = requests.get(url, timeout=10, stream=True)
+            self.current_url = self.response.url
+        else:
+            self.driver.get(url)
+            self.current_url = self.driver.current_url
+
+
+    def parse_page(self):
+        """This function parses the source of the page that is currently opened"""
+        if self.static:
+            self.page = lxml.html.document_fromstring(self.response.content)
+        else:
+            # lxml does not accept unicode strings with an xml encoding declaration, so the source is parsed as bytes
+            self.page = lxml.html.document_fromstring(self.driver.page_source.encode("utf-8"), parser=UTF8_HTML_PARSER)
+        self.index_page()
+
+
+    def index_page(self):
+        """This function walks the page once and groups its elements by tag name and id and collects all elements with visible text"""
+        self.elements_by_tag = defaultdict(list)
+        self.elements_by_id = {}
+        self.texts = []
+        invisible_elements = set()
+        # comments and processing instructions only have their own events, so they are never indexed
+        for event, element in lxml.etree.iterwalk(self.page, events=("start", "end", "comment", "pi")):
+            parent = element.getparent()
+            if event == "start":
+                self.elements_by_tag[element.tag].append(element)
+                if "id" in element.attrib:
+                    self.elements_by_id.setdefault(element.get("id"), element)
+
+                # exclude script, style and title elements and everything inside of them
+                if element.tag in ("script", "style", "title", "noscript") or parent in invisible_elements:
+                    invisible_elements.add(element)
+                elif not element.text is None and not element.text.strip() == "":
+                    self.texts.append(element)
+                continue
+
+            # the text after an element belongs to the parent of the element and follows the texts inside of the element
+            if not element.tail is None and not element.tail.strip() == "" and not parent is None and not parent in invisible_elements:
+                self.texts.append(parent)
+        self.indexed_page = self.page
+
+
+    def find_elements(self, name):
+        """This function returns all elements of the current page with the given tag name"""
+        if self.indexed_page is not self.page:
+            self.index_page()
+        return self.elements_by_tag.get(name, [])
+
+
+    def find_element_by_id(self, element_id):
+        """This function returns the first element of the current page with the given id or None if there is none"""
+        if self.indexed_page is not self.page:
+            self.index_page()
+        return self.elements_by_id.get(element_id)
+
+
+    def get_xpath(self, element):
+        """This function returns the xpath of an element of the current page"""
+        if element is None:
+            return "/html"
+        return element.getroottree().getpath(element)
 
 
     def test_page(self):
         """This function executes the tests for the current page. If tests for subpages are enabled, it will also test all subpages"""
-        self.page = BeautifulSoup(self.driver.page_source, "html.parser")
-        print("\n\n" + self.driver.current_url + "\n---------------------")
+        self.check_page()
+        sys.stdout.write(self.pop_output())
+
+        if self.follow:
+            self.test_subpages()
+
+
+    def check_page(self):
+        """This function executes all checks for the current page and takes a screenshot if screenshots are enabled"""
+        self.log("\n\n" + self.current_url + "\n---------------------")
         self.check_doc_language()
         self.check_alt_texts()
         self.check_input_labels()
         self.check_buttons()
         self.check_links()
-        self.check_color_contrast()
+        # the color contrast can only be checked with the styles computed by a browser
+        if not self.static:
+            self.check_color_contrast()
 
         if self.screenshots:
             dir_path = os.path.dirname(os.path.realpath(__file__))
-            hostname = urllib.parse.urlparse(self.driver.current_url).hostname
+            hostname = urllib.parse.urlsplit(self.current_url).hostname
             self.driver.get_screenshot_as_file(dir_path + "/screenshots/" + hostname + "-" + str(time.time()) + ".png")
 
-        if self.follow:
-            self.visited_links.append(self.driver.current_url)
-
-            # get all links on the page and iterate over the list of links
-            link_list = self.driver.find_elements(by="tag name", value="a")
-            for i in range(len(link_list)):
-                self.driver.execute_script("elements = document.getElementsByTagName('a'); \
-                                            for (var element of elements) {element.setAttribute('target', '')}")
-                link = link_list[i]
-
-                # get the full link and check if it needs to be visited
-                full_link = str(urllib.parse.urljoin(self.url, link.get_attribute("href")))
-                if not link.is_displayed() or link.get_attribute("href") == "" or link.get_attribute("href") is None \
-                        or full_link == self.driver.current_url or full_link in self.visited_links:
-                    continue
-                link_url = link.get_attribute("href")
-
-                # open the link in a new browser window
-                self.driver.execute_script("window.open('');")
-                self.driver.switch_to.window(self.driver.window_handles[len(self.driver.window_handles)-1])
-                self.driver.get(link_url)
 
-                # get back to the previous window when the link should not be tested
-                if self.driver.current_url in self.visited_links or not urllib.parse.urlparse(self.url).hostname in self.driver.current_url:
-                    self.driver.switch_to.window(self.driver.window_handles[self.driver.window_handles.index(self.driver.current_window_handle)-1])
-                    continue
-
-                self.test_page()
-
-            self.driver.switch_to.window(self.driver.window_handles[self.driver.window_handles.index(self.driver.current_window_handle)-1])
+    def log(self, *values):
+        """This function adds a line to the output of the current page, the output is written at once after the page is tested"""
+        self.output.append(" ".join(str(value) for value in values))
+
+
+    def pop_output(self):
+        """This function returns the collected output of the current page and clears it"""
+        output = "".join(line + "\n" for line in self.output)
+        self.output.clear()
+        return output
+
+
+    def test_subpages(self):
+        """This function tests all subpages that can be reached from the current page, in parallel if more than one worker is set"""
+        self.visited_links.add(normalize_url(self.current_url))
+        config = {"url": self.url, "chosen_driver": self.chosen_driver, "headless": self.headless, "screenshots": self.screenshots,
+                  "browser_height": self.browser_height, "browser_width": self.browser_width, "static": self.static}
+        links = self.get_links()
+        executor = None
+        original_window = None if self.static else self.driver.current_window_handle
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=start_worker, initargs=(config,))
+        elif not self.static:
+            # test all subpages in one new tab, so that the current page stays open in its own window
+            self.driver.switch_to.new_window("tab")
+
+        try:
+            # test the subpages level by level, each level consists of the new links found on the previous level
+            while links:
+                self.visited_links.update(links)
+                if executor is None:
+                    results = (AccessibilityTester(**config).test_subpage(self.driver, link) for link in links)
+                else:
+                    results = executor.map(test_subpage_in_worker, [config] * len(links), links)
+
+                new_links = {}
+                for link, result in zip(links, results):
+                    # skip subpages of other websites and subpages that redirected to an already tested page
+                    if result is None or (not normalize_url(result[0]) == link and normalize_url(result[0]) in self.visited_links):
+                        continue
+                    current_url, output, correct, wrong, page_links = result
+                    self.visited_links.add(normalize_url(current_url))
+
+                    sys.stdout.write(output)
+                    self.correct.update(correct)
+                    self.wrong.update(wrong)
+
+                    # a dict keeps the order in which the new links were found
+                    new_links.update(dict.fromkeys(page_link for page_link in page_links if not page_link in self.visited_links))
+                # a redirect later on the same level can reach a page that is already in the new links
+                links = [new_link for new_link in new_links if not new_link in self.visited_links]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            elif not self.static:
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
+
+
+    def test_subpage(self, driver, link):
+        """This function opens the link with the given webdriver and tests the page. It returns None if the page belongs to another website
+        or can not be loaded, otherwise the url of the page, the output and results of the tests and the links on the page"""
+        self.driver = driver
+        try:
+            self.open_page(link)
+        except requests.RequestException:
+            return None
+        # in static mode only html documents can be tested, the body of other responses is not downloaded
+        if not self.hostname in self.current_url or (self.static and not "html" in self.response.headers.get("Content-Type", "")):
+            if self.static:
+                self.response.close()
+            return None
+
+        # skip pages that fail to download or that are empty
+        try:
+            self.parse_page()
+        except (requests.RequestException, lxml.etree.ParserError):
+            return None
+        self.check_page()
+        return self.current_url, self.pop_output(), self.correct, self.wrong, self.get_links()
+
+
+    def get_links(self):
+        """This function returns the full urls of all visible links on the current page that have not been visited yet"""
+        links = {}
+        current_url = normalize_url(self.current_url)
+        if self.static:
+            links_on_page = self.get_static_links()
+        else:
+            links_on_page = self.driver.execute_script(LINKS_SCRIPT)
+        for href, visible in links_on_page:
+            # check if the link needs to be visited
+            if not visible or not urllib.parse.urlsplit(href).scheme in ("http", "https"):
+                continue
+            # links that only differ in the fragment lead to the same page
+            href = normalize_url(href)
+            if href == current_url or href in self.visited_links:
+                continue
+            links[href] = None
+        return list(links)
+
+
+    def get_static_links(self):
+        """This function returns the full urls of all links on the parsed page resolved like in a browser, together with their visibility"""
+        # the first base element with a href attribute defines the url that relative links are resolved against
+        base_url = self.current_url
+        for base_element in self.find_elements("base"):
+            if "href" in base_element.attrib:
+                base_url = urllib.parse.urljoin(self.current_url, base_element.get("href").strip())
+                break
+
+        # the visibility of links is unknown without a browser, so all links with a href attribute are used
+        links_on_page = []
+        for link_element in self.find_elements("a"):
+            if not "href" in link_element.attrib:
+                continue
+            try:
+                links_on_page.append((urllib.parse.urljoin(base_url, link_element.get("href").strip()), True))
+            except ValueError:
+                continue
+        return links_on_page
 
 
     def check_doc_language(self):
         """This function checks if the doc language is set (3.1.1 H57)"""
         # check if language attribute exists and is not empty
-        lang_attr = self.page.find("html").get_attribute_list("lang")[0]
+        lang_attr = self.find_elements("html")[0].get("lang")
         if not lang_attr is None and not lang_attr == "":
-            print("  Document language is set")
+            self.log("  Document language is set")
             self.correct["doc_language"] += 1
         elif not lang_attr is None:
-            print("x Document language is empty")
+            self.log("x Document language is empty")
             self.wrong["doc_language"] += 1
         else:
-            print("x Document language is missing")
+            self.log("x Document language is missing")
             self.wrong["doc_language"] += 1
 
 
     def check_alt_texts(self):
         """This function checks if all images on the page have an alternative text (1.1.1 H37)"""
         # get all img elements
-        img_elements = self.page.find_all("img")
+        img_elements = self.find_elements("img")
         for img_element in img_elements:
             # check if img element has an alternative text that is not empty
-            alt_text = img_element.get_attribute_list('alt')[0]
+            alt_text = img_element.get('alt')
             if not alt_text is None and not alt_text == "":
-                print("  Alt text is correct", xpath_soup(img_element))
+                self.log("  Alt text is correct", self.get_xpath(img_element))
                 self.correct["alt_texts"] += 1
             elif not alt_text is None:
-                print("x Alt text is empty", xpath_soup(img_element))
+                self.log("x Alt text is empty", self.get_xpath(img_element))
                 self.wrong["alt_texts"] += 1
             else:
-                print("x Alt text is missing", xpath_soup(img_element))
+                self.log("x Alt text is missing", self.get_xpath(img_element))
                 self.wrong["alt_texts"] += 1
 
 
     def check_input_labels(self):
         """This function checks if all input elements on the page have some form of label (1.3.1 H44 & ARIA16)"""
         # get all input and label elements
-        input_elements = self.page.find_all("input")
-        label_elements = self.page.find_all("label")
+        input_elements = self.find_elements("input")
+        label_elements = self.find_elements("label")
+        # collect the ids that are referenced by the "for" attribute of a label element
+        labelled_ids = {label_element.get('for') for label_element in label_elements if "for" in label_element.attrib}
         for input_element in input_elements:
             # exclude input element of type hidden, submit, reset and button
-            if ("type" in input_element.attrs and not input_element['type'] == "hidden" and not input_element['type'] == "submit" \
-                    and not input_element['type'] == "reset" and not input_element['type'] == "button") or "type" not in input_element.attrs:
+            if ("type" in input_element.attrib and not input_element.get('type') == "hidden" and not input_element.get('type') == "submit" \
+                    and not input_element.get('type') == "reset" and not input_element.get('type') == "button") or "type" not in input_element.attrib:
                 # check if input is of type image and has a alt text that is not empty
-                if "type" in input_element.attrs and input_element['type'] == "image" and "alt" in input_element.attrs \
-                        and not input_element['alt'] == "":
-                    print("  Input of type image labelled with alt text", xpath_soup(input_element))
+                if "type" in input_element.attrib and input_element.get('type') == "image" and "alt" in input_element.attrib \
+                        and not input_element.get('alt') == "":
+                    self.log("  Input of type image labelled with alt text", self.get_xpath(input_element))
                     self.correct["input_labels"] += 1
                 # check if input element uses aria-label
-                elif "aria-label" in input_element.attrs and not input_element['aria-label'] == "":
-                    print("  Input labelled with aria-label attribute", xpath_soup(input_element))
+                elif "aria-label" in input_element.attrib and not input_element.get('aria-label') == "":
+                    self.log("  Input labelled with aria-label attribute", self.get_xpath(input_element))
                     self.correct["input_labels"] += 1
                 # check if input element uses aria-labelledby
-                elif "aria-labelledby" in input_element.attrs and not input_element['aria-labelledby'] == "":
-                    label_element = self.page.find(id=input_element['aria-labelledby'])
+                elif "aria-labelledby" in input_element.attrib and not input_element.get('aria-labelledby') == "":
+                    label_element = self.find_element_by_id(input_element.get('aria-labelledby'))
                     if not label_element is None:
-                        texts_in_label_element = label_element.findAll(text=True)
-                        if not texts_in_label_element == []:
-                            print("  Input labelled with aria-labelledby attribute", xpath_soup(input_element))
+                        texts_in_label_element = label_element.text_content()
+                        if not texts_in_label_element == "":
+                            self.log("  Input labelled with aria-labelledby attribute", self.get_xpath(input_element))
                             self.correct["input_labels"] += 1
                         else:
-                            print("x Input labelled with aria-labelledby attribute, but related label has no text", xpath_soup(input_element))
+                            self.log("x Input labelled with aria-labelledby attribute, but related label has no text", self.get_xpath(input_element))
                             self.wrong["input_labels"] += 1
                     else:
-                        print("x Input labelled with aria-labelledby attribute, but related label does not exist", xpath_soup(input_element))
+                        self.log("x Input labelled with aria-labelledby attribute, but related label does not exist", self.get_xpath(input_element))
                         self.wrong["input_labels"] += 1
                 else:
-                    # check if input element has a corresponding label element
-                    label_correct = False
-                    for label_element in label_elements:
-                        # check if "for" attribute of label element is identical to "id" of input element
-                        if "for" in label_element.attrs and "id" in input_element.attrs and label_element['for'] == input_element['id']:
-                            label_correct = True
-                    if label_correct:
-                        print("  Input labelled with label element", xpath_soup(input_element))
+                    # check if input element has a label element whose "for" attribute is identical to its "id"
+                    if "id" in input_element.attrib and input_element.get('id') in labelled_ids:
+                        self.log("  Input labelled with label element", self.get_xpath(input_element))
                         self.correct["input_labels"] += 1
                     else:
-                        print("x Input not labelled at all", xpath_soup(input_element))
+                        self.log("x Input not labelled at all", self.get_xpath(input_element))
                         self.wrong["input_labels"] += 1
 
 
     def check_buttons(self):
         """This function checks if all buttons and input elements of the types submit, button and reset have some form of content (1.1.1 & 2.4.4)"""
         # get all buttons and input elements of the types submit, button and reset
-        input_elements = self.page.find_all("input", type=["submit", "button", "reset"])
-        button_elements = self.page.find_all("button")
+        input_elements = [input_element for input_element in self.find_elements("input")
+                          if input_element.get("type") in ("submit", "button", "reset")]
+        button_elements = self.find_elements("button")
 
         for input_element in input_elements:
             # check if input element has a value attribute that is not empty
-            if "value" in input_element.attrs and not input_element['value'] == "":
-                print("  Button has content", xpath_soup(input_element))
+            if "value" in input_element.attrib and not input_element.get('value') == "":
+                self.log("  Button has content", self.get_xpath(input_element))
                 self.correct["empty_buttons"] += 1
             else:
-                print("x Button is empty", xpath_soup(input_element))
+                self.log("x Button is empty", self.get_xpath(input_element))
                 self.wrong["empty_buttons"] += 1
 
         for button_element in button_elements:
             # check if the button has content or a title
-            texts = button_element.findAll(text=True)
-            if not texts == [] or ("title" in button_element.attrs and not button_element["title"] == ""):
-                print("  Button has content", xpath_soup(button_element))
+            texts = button_element.text_content()
+            if not texts == "" or ("title" in button_element.attrib and not button_element.get("title") == ""):
+                self.log("  Button has content", self.get_xpath(button_element))
                 self.correct["empty_buttons"] += 1
             else:
-                print("x Button is empty", xpath_soup(button_element))
+                self.log("x Button is empty", self.get_xpath(button_element))
                 self.wrong["empty_buttons"] += 1
 
 
     def check_links(self):
         """This function checks if all links on the page have some form of content (2.4.4 G91 & H30)"""
         # get all a elements
-        link_elements = self.page.find_all("a")
+        link_elements = self.find_elements("a")
         for link_element in link_elements:
             # check if link has content
-            texts_in_link_element = link_element.findAll(text=True)
-            img_elements = link_element.findChildren("img", recursive=False)
+            texts_in_link_element = link_element.text_content()
+            img_elements = link_element.findall("img")
             all_alt_texts_set = True
             for img_element in img_elements:
-                alt_text = img_element.get_attribute_list('alt')[0]
+                alt_text = img_element.get('alt')
                 if alt_text is None or alt_text == "":
                     all_alt_texts_set = False
-            if not texts_in_link_element == [] or (not img_elements == [] and all_alt_texts_set):
-                print("  Link has content", xpath_soup(link_element))
+            if not texts_in_link_element == "" or (not img_elements == [] and all_alt_texts_set):
+                self.log("  Link has content", self.get_xpath(link_element))
                 self.correct["empty_links"] += 1
             else:
-                print("x Link is empty", xpath_soup(link_element))
+                self.log("x Link is empty", self.get_xpath(link_element))
                 self.wrong["empty_links"] += 1
 
 
     def check_color_contrast(self):
         """This function checks if all texts on the page have high enough contrast to the color of the background (1.4.3 G18 & G145 (& 148))"""
         # exclude script, style, title and empty elements as well as doctype and comments
-        texts_on_page = extract_texts(self.page)
-        input_elements = self.page.find_all("input")
-        elements_with_text = texts_on_page + input_elements
-        for text in elements_with_text:
-            selenium_element = self.driver.find_element(by="xpath", value=xpath_soup(text))
+        # exclude input elements without a type and hidden input elements before their styles are read
+        input_elements = [input_element for input_element in self.find_elements("input")
+                          if "type" in input_element.attrib and not input_element.get('type') == "hidden"]
+        elements_with_text = self.texts + input_elements
+        # read the computed styles of all elements with a single call to the webdriver
+        xpaths = [self.get_xpath(text) for text in elements_with_text]
+        computed_styles = self.driver.execute_script(COMPUTED_STYLES_SCRIPT, xpaths)
+        for text, xpath, styles in zip(elements_with_text, xpaths, computed_styles):
+            # exclude elements that could not be found in the browser
+            if styles is None:
+                continue
+            element_visible, text_color, background_color, font_size, font_weight = styles
             # exclude invisible texts
-            element_visible = selenium_element.value_of_css_property('display')
-            if not element_visible == "none" and (not text.name == "input" or (text.name == "input" \
-                    and "type" in text.attrs and not text['type'] == "hidden")):
-                text_color = convert_to_rgba_value(selenium_element.value_of_css_property('color'))
-                background_color = get_background_color(self.driver, text)
+            if not element_visible == "none":
+                text_rgba = convert_to_rgba_value(text_color)
+                background_rgba = convert_to_rgba_value(background_color)
+                # exclude texts with colors in a format that is not supported
+                if text_rgba is None or background_rgba is None:
+                    continue
 
                 # calculate contrast between text color and background color
-                contrast = get_contrast_ratio(eval(text_color[4:]), eval(background_color[4:]))
-
-                # get font size and font weight
-                font_size = selenium_element.value_of_css_property('font-size')
-                font_weight = selenium_element.value_of_css_property('font-weight')
-
+                contrast = get_contrast_ratio(text_rgba, background_rgba)
+
+                # large texts only need a contrast of 3 instead of 4.5
+                font_size_match = None if font_size is None else PIXEL_PATTERN.match(font_size)
+                font_size_px = None if font_size_match is None else float(font_size_match.group(1))
+                if not font_size_px is None and (font_size_px >= 18 or \
+                        ((font_weight in BOLD_FONT_WEIGHTS or text.tag == "strong") and font_size_px >= 14)):
+                    required_contrast = 3
+                else:
+                    required_contrast = 4.5
 
-                if not font_size is None and font_size.__contains__("px") and \
-                        (int(''.join(filter(str.isdigit, font_size))) >= 18 or ((font_weight == "bold" or font_weight == "700" \
-                        or font_weight == "800" or font_weight == "900" or text.name == "strong") \
-                        and int(''.join(filter(str.isdigit, font_size))) >= 14)):
-                    if contrast >= 3:
-                        print("  Contrast meets minimum requirements", xpath_soup(text), text_color, background_color)
-                        self.correct["color_contrast"] += 1
-                    else:
-                        print("x Contrast does not meet minimum requirements", xpath_soup(text), text_color, background_color)
-                        self.wrong["color_contrast"] += 1
+                if contrast >= required_contrast:
+                    self.log("  Contrast meets minimum requirements", xpath, text_color, background_color)
+                    self.correct["color_contrast"] += 1
                 else:
-                    if contrast >= 4.5:
-                        print("  Contrast meets minimum requirements", xpath_soup(text), text_color, background_color)
-                        self.correct["color_contrast"] += 1
-                    else:
-                        print("x Contrast does not meet minimum requirements", xpath_soup(text), text_color, background_color)
-                        self.wrong["color_contrast"] += 1
+                    self.log("x Contrast does not meet minimum requirements", xpath, text_color, background_color)
+                    self.wrong["color_contrast"] += 1
 
 
     def calculate_result(self):
@@ -331,11 +601,11 @@ class AccessibilityTester:
         print("\nResult")
         print("---------------------")
         print("Correct:", correct)
-        for category, value in self.correct.items():
-            print(" ", category + ":", value)
+        for category in self.CATEGORIES:
+            print(" ", category + ":", self.correct[category])
         print("Errors:", false)
-        for category, value in self.wrong.items():
-            print(" ", category + ":", value)
+        for category in self.CATEGORIES:
+            print(" ", category + ":", self.wrong[category])
         print("Ratio (correct to total):", round(correct/(correct+false), 2), "\n")
 
         # check if ratio correct/total reaches wanted minimum value
@@ -346,89 +616,42 @@ class AccessibilityTester:
             raise Exception("Too many accessibility errors - try fix them!")
 
 
-# src: https://gist.github.com/ergoithz/6cf043e3fdedd1b94fcf
-def xpath_soup(element):
-    # pylint: disable=consider-using-f-string
-    """This function calculates the xpath of an element"""
-    if element is None:
-        return '/html'
-    components = []
-    child = element if element.name else element.parent
-    for parent in child.parents:  # type: bs4.element.Tag
-        siblings = parent.find_all(child.name, recursive=False)
-        components.append(
-            child.name if 1 == len(siblings) else '%s[%d]' % (
-                child.name,
-                next(i for i, s in enumerate(siblings, 1) if s is child)
-                )
-            )
-        child = parent
-    components.reverse()
-    if not components:
-        return '/html'
-    return '/%s' % '/'.join(components)
-
-def extract_texts(soup):
-    """This function extracts all texts from a page"""
-    soup2 = soup
-
-    # remove script, style and title elements
-    for invisible_element in soup2(["script", "style", "title", "noscript"]):
-        invisible_element.extract()
-
-    # remove comments
-    comments = soup2.findAll(text=lambda text:isinstance(text, Comment))
-    for comment in comments:
-        comment.extract()
-
-    # remove doctype
-    doctype = soup2.find(text=lambda text:isinstance(text, Doctype))
-    if not doctype is None:
-        doctype.extract()
-
-    # get all elements with text
-    texts = []
-    texts_on_page = soup2.findAll(text=True)
-    for text in texts_on_page:
-        if not text.strip() == "" and not text == "\n":
-            texts.append(text.parent)
-
-    return texts
-
-def get_background_color(driver, text):
-    """This function returns the background color of a given text"""
-    if text is None:
-        return "rgba(255,255,255,1)"
-
-    selenium_element = driver.find_element(by="xpath", value=xpath_soup(text))
-    background_color = convert_to_rgba_value(selenium_element.value_of_css_property('background-color'))
-
-    if eval(background_color[4:])[3] == 0:
-        return get_background_color(driver, text.parent)
-
-    return background_color
+# webdriver of the current worker process when subpages are tested in parallel
+worker_driver = None
+
+def start_worker(config):
+    """This function starts the webdriver of a worker process, the webdriver is quit when the worker process exits"""
+    global worker_driver # pylint: disable=global-statement
+    accessibility_tester = AccessibilityTester(**config)
+    if accessibility_tester.static:
+        return
+    accessibility_tester.create_driver()
+    worker_driver = accessibility_tester.driver
+    multiprocessing.util.Finalize(None, worker_driver.quit, exitpriority=0)
 
+def test_subpage_in_worker(config, link):
+    """This function tests a subpage with the webdriver of the current worker process"""
+    return AccessibilityTester(**config).test_subpage(worker_driver, link)
+
+def normalize_url(url):
+    """This function removes the fragment from the url, so that links to parts of a page are treated as links to the page itself"""
+    return urllib.parse.urlsplit(url)._replace(fragment="").geturl()
+
+
+@functools.lru_cache(maxsize=1024)
 def convert_to_rgba_value(color):
-    """This function converts a color value to the rgba format"""
-    if color[:4] != "rgba":
-        rgba_tuple = eval(color[3:]) + (1,)
-        color = "rgba" + str(rgba_tuple)
+    """This function converts a color value in the rgb or rgba format to a tuple of red, green, blue and alpha"""
+    match = RGBA_PATTERN.match(color)
+    if match is None:
+        return None
 
-    return color
+    red, green, blue, alpha = match.groups()
+    return (float(red), float(green), float(blue), 1.0 if alpha is None else float(alpha))
 
 def get_contrast_ratio(text_color, background_color):
     """This function calculates the contrast ratio between text color and background color"""
-    # preparing the RGB values
-    r_text = convert_rgb_8bit_value(text_color[0])
-    g_text = convert_rgb_8bit_value(text_color[1])
-    b_text = convert_rgb_8bit_value(text_color[2])
-    r_background = convert_rgb_8bit_value(background_color[0])
-    g_background = convert_rgb_8bit_value(background_color[1])
-    b_background = convert_rgb_8bit_value(background_color[2])
-
-    # calculating the relative luminance
-    luminance_text = 0.2126 * r_text + 0.7152 * g_text + 0.0722 * b_text
-    luminance_background = 0.2126 * r_background + 0.7152 * g_background + 0.0722 * b_background
+    luminance_text = get_relative_luminance(text_color)
+    luminance_background = get_relative_luminance(background_color)
 
     # check if luminance_text or luminance_background is lighter
     if luminance_text > luminance_background:
@@ -440,6 +663,17 @@ def get_contrast_ratio(text_color, background_color):
 
     return contrast_ratio
 
+@functools.lru_cache(maxsize=1024)
+def get_relative_luminance(color):
+    """This function calculates the relative luminance of a color given as a tuple, the result is cached for each color"""
+    # preparing the RGB values
+    red = SRGB_TO_LINEAR[int(round(color[0]))]
+    green = SRGB_TO_LINEAR[int(round(color[1]))]
+    blue = SRGB_TO_LINEAR[int(round(color[2]))]
+
+    # calculating the relative luminance
+    return 0.2126 * red + 0.7152 * green + 0.0722 * blue
+
 def convert_rgb_8bit_value(single_rgb_8bit_value):
     """This function converts an rgb value to the needed format"""
     # dividing the 8-bit value through 255
@@ -450,3 +684,6 @@ def convert_rgb_8bit_value(single_rgb_8bit_value):
         return srgb / 12.92
 
     return ((srgb + 0.055) / 1.055) ** 2.4
+
+# converted values for all 256 possible 8-bit rgb values, so that they only have to be calculated once
+SRGB_TO_LINEAR = tuple(convert_rgb_8bit_value(value) for value in range(256))
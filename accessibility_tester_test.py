@@ -1,8 +1,10 @@
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from collections import Counter
+from types import SimpleNamespace
 import multiprocessing
 import sys
 
-from bs4 import BeautifulSoup
+import lxml.html
 
 import accessibility_tester
 
@@ -13,21 +15,21 @@ SERVER_PORT = 45459
 def test_check_doc_language():
     # missing document language - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html></html>")
     test_accessibility_tester.check_doc_language()
     assert test_accessibility_tester.wrong["doc_language"] == 1
     assert test_accessibility_tester.correct["doc_language"] == 0
 
     # empty document language - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html lang=''></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html lang=''></html>")
     test_accessibility_tester.check_doc_language()
     assert test_accessibility_tester.wrong["doc_language"] == 1
     assert test_accessibility_tester.correct["doc_language"] == 0
 
     # set document language - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html lang='de'></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html lang='de'></html>")
     test_accessibility_tester.check_doc_language()
     assert test_accessibility_tester.wrong["doc_language"] == 0
     assert test_accessibility_tester.correct["doc_language"] == 1
@@ -36,21 +38,21 @@ def test_check_doc_language():
 def test_check_alt_texts():
     # missing alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><img src=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><img src=''></body></html>")
     test_accessibility_tester.check_alt_texts()
     assert test_accessibility_tester.wrong["alt_texts"] == 1
     assert test_accessibility_tester.correct["alt_texts"] == 0
 
     # empty alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><img alt='' src=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><img alt='' src=''></body></html>")
     test_accessibility_tester.check_alt_texts()
     assert test_accessibility_tester.wrong["alt_texts"] == 1
     assert test_accessibility_tester.correct["alt_texts"] == 0
 
     # set alt attribute - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><img alt='beautiful image' src=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><img alt='beautiful image' src=''></body></html>")
     test_accessibility_tester.check_alt_texts()
     assert test_accessibility_tester.wrong["alt_texts"] == 0
     assert test_accessibility_tester.correct["alt_texts"] == 1
@@ -59,91 +61,91 @@ def test_check_alt_texts():
 def test_check_input_labels():
     # input type hidden - should be ignored
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='hidden'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='hidden'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 0
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type image without alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='image'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='image'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type image with empty alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='image' alt=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='image' alt=''></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type image with filled alt attribute - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='image' alt='image as button'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='image' alt='image as button'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 0
     assert test_accessibility_tester.correct["input_labels"] == 1
 
     # input type text without aria-labelledby or label element - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with empty aria-labelledby attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' aria-labelledby=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' aria-labelledby=''></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with filled aria-labelledby attribute, but related label does not exist - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' aria-labelledby='label'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' aria-labelledby='label'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with filled aria-labelledby attribute, but related label has no text - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' aria-labelledby='label'><p id='label'></p></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' aria-labelledby='label'><p id='label'></p></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with filled aria-labelledby attribute and correct related label - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' aria-labelledby='label'><p id='label'>Label</p></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' aria-labelledby='label'><p id='label'>Label</p></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 0
     assert test_accessibility_tester.correct["input_labels"] == 1
 
     # input type text with empty for attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' for=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' for=''></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with filled id attribute but no label - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text' id='test-input'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text' id='test-input'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
 
     # input type text with filled id attribute and correct label - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><label for='test-input'>This is an input field</label><input type='text' id='test-input'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><label for='test-input'>This is an input field</label><input type='text' id='test-input'></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 0
     assert test_accessibility_tester.correct["input_labels"] == 1
 
     # no specified input type with no labels - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input></body></html>")
     test_accessibility_tester.check_input_labels()
     assert test_accessibility_tester.wrong["input_labels"] == 1
     assert test_accessibility_tester.correct["input_labels"] == 0
@@ -152,70 +154,70 @@ def test_check_input_labels():
 def test_check_buttons():
     # input type text - should be ignored
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='text'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='text'></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 0
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # input type submit without value attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='submit'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='submit'></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 1
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # input type submit with empty value attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='submit' value=''></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='submit' value=''></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 1
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # input type submit with filled value attribute - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><input type='submit' value='Submit'></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><input type='submit' value='Submit'></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 0
     assert test_accessibility_tester.correct["empty_buttons"] == 1
 
     # button element without text or title attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button></button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button></button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 1
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # button element with an empty other element - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button><p></p></button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button><p></p></button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 1
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # button element with text - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button>Click here!</button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button>Click here!</button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 0
     assert test_accessibility_tester.correct["empty_buttons"] == 1
 
     # button element with text inside another element - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button><p>Click here!</p></button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button><p>Click here!</p></button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 0
     assert test_accessibility_tester.correct["empty_buttons"] == 1
 
     # button element with empty title attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button title=''></button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button title=''></button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 1
     assert test_accessibility_tester.correct["empty_buttons"] == 0
 
     # button element with filled title attribute - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><button title='Click here!'></button></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><button title='Click here!'></button></body></html>")
     test_accessibility_tester.check_buttons()
     assert test_accessibility_tester.wrong["empty_buttons"] == 0
     assert test_accessibility_tester.correct["empty_buttons"] == 1
@@ -224,40 +226,84 @@ def test_check_buttons():
 def test_check_links():
     # link element without text - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><a href='/'></a></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/'></a></body></html>")
     test_accessibility_tester.check_links()
     assert test_accessibility_tester.wrong["empty_links"] == 1
     assert test_accessibility_tester.correct["empty_links"] == 0
 
     # link element with text - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><a href='/'>Click here</a></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/'>Click here</a></body></html>")
     test_accessibility_tester.check_links()
     assert test_accessibility_tester.wrong["empty_links"] == 0
     assert test_accessibility_tester.correct["empty_links"] == 1
 
     # link element with image element without alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><a href='/'><img src=''></a></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/'><img src=''></a></body></html>")
     test_accessibility_tester.check_links()
     assert test_accessibility_tester.wrong["empty_links"] == 1
     assert test_accessibility_tester.correct["empty_links"] == 0
 
     # link element with image element with empty alt attribute - should be wrong
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><a href='/'><img alt='' src=''></a></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/'><img alt='' src=''></a></body></html>")
     test_accessibility_tester.check_links()
     assert test_accessibility_tester.wrong["empty_links"] == 1
     assert test_accessibility_tester.correct["empty_links"] == 0
 
     # link element with image element with filled alt attribute - should be correct
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
-    test_accessibility_tester.page = BeautifulSoup("<html><body><a href='/'><img alt='beautiful image' src=''></a></body></html>", "html.parser")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/'><img alt='beautiful image' src=''></a></body></html>")
     test_accessibility_tester.check_links()
     assert test_accessibility_tester.wrong["empty_links"] == 0
     assert test_accessibility_tester.correct["empty_links"] == 1
 
 
+def test_index_page():
+    # texts inside script, style, title and noscript elements as well as comments - should be excluded
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><head><title>Title</title><style>p {}</style></head><body><!-- Comment --><p>Some Text</p>"
+                                                   "<script>var a;</script><noscript><p>No JavaScript</p></noscript></body></html>")
+    test_accessibility_tester.index_page()
+    assert [text.tag for text in test_accessibility_tester.texts] == ["p"]
+
+    # the page itself - should not be changed
+    assert len(list(test_accessibility_tester.page.iter("title", "style", "script", "noscript"))) == 4
+
+    # texts before, inside and after child elements and comments - should be in document order
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><p>Before <b>Inside</b> After<!-- Comment --> End</p><div>Last</div></body></html>")
+    test_accessibility_tester.index_page()
+    assert [text.tag for text in test_accessibility_tester.texts] == ["p", "b", "p", "p", "div"]
+
+
+def test_parse_page():
+    # page source with xml encoding declaration and different declared charset - should be parsed as utf-8
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
+    test_accessibility_tester.driver = SimpleNamespace(page_source="<?xml version='1.0' encoding='ISO-8859-1'?><html><head><meta charset='ISO-8859-1'></head>"
+                                                                   "<body><p>Caf\u00e9</p></body></html>")
+    test_accessibility_tester.parse_page()
+    assert [text.text for text in test_accessibility_tester.texts] == ["Caf\u00e9"]
+
+
+def test_get_links_static():
+    # links of the same page, visited links and links without http or https scheme - should be excluded
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("http://example.com/", static=True)
+    test_accessibility_tester.current_url = "http://example.com/"
+    test_accessibility_tester.visited_links = {"http://example.com/b"}
+    test_accessibility_tester.page = lxml.html.fromstring("<html><body><a href='/a'>A</a><a href='b'>B</a><a href='/'>Home</a><a>No Link</a>"
+                                                   "<a href='mailto:mail@example.com'>Mail</a><a href='/a'>A</a><a href='/a#part'>A</a><a href='#top'>Top</a></body></html>")
+    assert test_accessibility_tester.get_links() == ["http://example.com/a"]
+
+    # links with whitespace around the url and a base element - should be resolved against the base url
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("http://example.com/dir/page", static=True)
+    test_accessibility_tester.current_url = "http://example.com/dir/page"
+    test_accessibility_tester.page = lxml.html.fromstring("<html><head><base target='_blank'><base href=' /other/ '><base href='/ignored/'></head>"
+                                                   "<body><a href=' sub '>Sub</a><a href='http://[invalid'>Invalid</a></body></html>")
+    assert test_accessibility_tester.get_links() == ["http://example.com/other/sub"]
+
+
 def test_check_color_contrast():
     # Test is not working on Windows, so it will be skipped if sys.platform equals win32
     if sys.platform != 'win32':
@@ -321,6 +367,13 @@ def test_check_color_contrast():
         assert test_accessibility_tester.wrong["color_contrast"] == 0
         assert test_accessibility_tester.correct["color_contrast"] == 1
 
+        # black text with fractional font-size 13.3333px on grey background - should be wrong
+        test_accessibility_tester = accessibility_tester.AccessibilityTester(f"http://{HOST_NAME}:{SERVER_PORT}/color-contrast-test-case-9")
+        test_accessibility_tester.start_driver()
+        test_accessibility_tester.check_color_contrast()
+        assert test_accessibility_tester.wrong["color_contrast"] == 1
+        assert test_accessibility_tester.correct["color_contrast"] == 0
+
         web_server.server_close()
         proc.terminate()
         proc.join()
@@ -328,6 +381,53 @@ def test_check_color_contrast():
         print("sys.platform equals win32 - skipping test")
 
 
+def test_test_subpages(capsys):
+    # subpages linked on several pages, redirects to tested subpages and to subpages of the next level, fragments and links to other websites
+    # - should be tested once or skipped
+    web_server = HTTPServer((HOST_NAME, SERVER_PORT), CrawlTestServer)
+    proc = multiprocessing.Process(target=start_server, args=(web_server,))
+    proc.start()
+
+    try:
+        for workers in (1, 2):
+            test_accessibility_tester = accessibility_tester.AccessibilityTester(f"http://{HOST_NAME}:{SERVER_PORT}/crawl-test-case-1",
+                                                                                 follow=True, workers=workers, static=True)
+            test_accessibility_tester.start_driver()
+            test_accessibility_tester.test_page()
+            assert test_accessibility_tester.correct == Counter({"doc_language": 3, "empty_links": 11})
+            assert test_accessibility_tester.wrong == Counter({"doc_language": 1, "alt_texts": 1, "empty_buttons": 1})
+
+            output = capsys.readouterr().out
+            assert output.count("\n---------------------\n") == 4
+            for path in ("/crawl-test-case-1", "/page-a", "/page-b", "/page-c"):
+                assert output.count(f"http://{HOST_NAME}:{SERVER_PORT}{path}\n---------------------\n") == 1
+    finally:
+        web_server.server_close()
+        proc.terminate()
+        proc.join()
+
+
+def test_test_subpages_static(capsys):
+    # empty subpages, subpages with only a comment and subpages that are not html - should be skipped
+    web_server = HTTPServer((HOST_NAME, SERVER_PORT), CrawlTestServer)
+    proc = multiprocessing.Process(target=start_server, args=(web_server,))
+    proc.start()
+
+    try:
+        for workers in (1, 2):
+            test_accessibility_tester = accessibility_tester.AccessibilityTester(f"http://{HOST_NAME}:{SERVER_PORT}/static-test-case-1",
+                                                                                 follow=True, workers=workers, static=True)
+            test_accessibility_tester.start_driver()
+            test_accessibility_tester.test_page()
+            assert test_accessibility_tester.correct == Counter({"doc_language": 1, "empty_links": 3})
+            assert test_accessibility_tester.wrong == Counter()
+            assert capsys.readouterr().out.count("\n---------------------\n") == 1
+    finally:
+        web_server.server_close()
+        proc.terminate()
+        proc.join()
+
+
 def test_calculate_result(capsys):
     # case nothing found
     test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
@@ -341,6 +441,13 @@ def test_calculate_result(capsys):
     test_accessibility_tester.calculate_result()
     assert capsys.readouterr().out == "\nResult\n---------------------\nCorrect: 3\n  doc_language: 1\n  alt_texts: 0\n  input_labels: 1\n  empty_buttons: 0\n  empty_links: 1\n  color_contrast: 0\nErrors: 3\n  doc_language: 0\n  alt_texts: 1\n  input_labels: 0\n  empty_buttons: 1\n  empty_links: 0\n  color_contrast: 1\nRatio (correct to total): 0.5 \n\nAccessibility test successful - can deploy\n"
 
+    # case categories without results - should be reported with 0 in the same order
+    test_accessibility_tester = accessibility_tester.AccessibilityTester("test URL")
+    test_accessibility_tester.correct = Counter({"empty_links":1, "doc_language":1, "input_labels":1})
+    test_accessibility_tester.wrong = Counter({"color_contrast":1, "empty_buttons":1, "alt_texts":1})
+    test_accessibility_tester.calculate_result()
+    assert capsys.readouterr().out == "\nResult\n---------------------\nCorrect: 3\n  doc_language: 1\n  alt_texts: 0\n  input_labels: 1\n  empty_buttons: 0\n  empty_links: 1\n  color_contrast: 0\nErrors: 3\n  doc_language: 0\n  alt_texts: 1\n  input_labels: 0\n  empty_buttons: 1\n  empty_links: 0\n  color_contrast: 1\nRatio (correct to total): 0.5 \n\nAccessibility test successful - can deploy\n"
+
 
 def test_get_contrast_ratio():
     # highest contrast
@@ -359,6 +466,23 @@ def test_get_contrast_ratio():
     assert accessibility_tester.get_contrast_ratio(text_color, background_color) == 5.252
 
 
+def test_convert_to_rgba_value():
+    # rgb value - should get an alpha value of 1
+    assert accessibility_tester.convert_to_rgba_value("rgb(40, 40, 40)") == (40, 40, 40, 1)
+
+    # rgba value - should keep its alpha value
+    assert accessibility_tester.convert_to_rgba_value("rgba(240, 240, 240, 0.5)") == (240, 240, 240, 0.5)
+
+    # unsupported color format - should return None
+    assert accessibility_tester.convert_to_rgba_value("transparent") is None
+
+
+def test_normalize_url():
+    assert accessibility_tester.normalize_url("http://example.com/a#part") == "http://example.com/a"
+    assert accessibility_tester.normalize_url("http://example.com/a?b=c#part") == "http://example.com/a?b=c"
+    assert accessibility_tester.normalize_url("http://example.com/a") == "http://example.com/a"
+
+
 class ColorContrastTestServer(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path == "/color-contrast-test-case-1":
@@ -409,6 +533,81 @@ class ColorContrastTestServer(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(bytes("<html><body><div style='background-color: rgb(40, 40, 40)'><p style='color: rgba(240, 240, 240, 0); font-size: 14px'>Some Text</p></div></body></html>", "utf-8"))
 
+        if self.path == "/color-contrast-test-case-9":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html><body><div style='background-color: #666666'><p style='color: #000000; font-size: 13.3333px'>Some Text</p></div></body></html>", "utf-8"))
+
+class CrawlTestServer(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/crawl-test-case-1":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes(f"<html lang='en'><body><a href='/page-a'>A</a><a href='/page-b'>B</a><a href='/redirect'>Redirect</a>"
+                                   f"<a href='/page-a#section'>Section</a><a href='http://127.0.0.1:{SERVER_PORT}/other-website'>Other</a>"
+                                   "<a href='mailto:mail@example.com'>Mail</a><a href='/redirect-next-level'>Redirect</a></body></html>", "utf-8"))
+
+        if self.path == "/page-a":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html lang='en'><body><img src='image.png'><a href='/page-c'>C</a><a href='/crawl-test-case-1'>Home</a></body></html>", "utf-8"))
+
+        if self.path == "/page-b":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html><body><a href='/page-c'>C</a></body></html>", "utf-8"))
+
+        if self.path == "/page-c":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html lang='en'><body><button></button><a href='/page-a'>A</a></body></html>", "utf-8"))
+
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/page-b")
+            self.end_headers()
+
+        if self.path == "/redirect-next-level":
+            self.send_response(302)
+            self.send_header("Location", "/page-c")
+            self.end_headers()
+
+        if self.path == "/other-website":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html><body><img src='image.png'></body></html>", "utf-8"))
+
+        if self.path == "/static-test-case-1":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<html lang='en'><body><a href='/empty-page'>Empty</a><a href='/comment-page'>Comment</a>"
+                                   "<a href='/file.pdf'>File</a></body></html>", "utf-8"))
+
+        if self.path == "/empty-page":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes(" ", "utf-8"))
+
+        if self.path == "/comment-page":
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.end_headers()
+            self.wfile.write(bytes("<!-- Comment -->", "utf-8"))
+
+        if self.path == "/file.pdf":
+            self.send_response(200)
+            self.send_header("Content-type", "application/pdf")
+            self.end_headers()
+            self.wfile.write(bytes("%PDF-1.4", "utf-8"))
+
 def start_server(web_server):
     print("Server started http://{HOST_NAME}:{SERVER_PORT}")
     try:
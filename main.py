@@ -2,6 +2,8 @@
 import argparse
 import validators
 
+from accessibility_tester import AccessibilityTester
+
 
 def main():
     """The main function that reads the arguments from the command line and executes the tests with the given configuration"""
@@ -32,6 +34,12 @@ def main():
     parser.add_argument("-f", "--follow",
                         help = "defines if the program should also test subpages that are linked on the main page, default is False",
                         required = False, action = "store_true")
+    parser.add_argument("-w", "--workers", type=int,
+                        help = "the number of browsers that test subpages in parallel when following links, default is 1",
+                        required = False, default = 1)
+    parser.add_argument("--static",
+                        help = "defines if the pages should be downloaded without a browser, which is faster but skips the color contrast check and ignores the visibility of links, default is False",
+                        required = False, action = "store_true")
 
     argument = parser.parse_args()
 
@@ -43,6 +51,8 @@ def main():
     browser_height = argument.height
     browser_width = argument.width
     should_follow = argument.follow
+    workers = argument.workers
+    static = argument.static
 
     # validate values of url, required_degree and driver
     if not validators.url(url):
@@ -54,14 +64,22 @@ def main():
     if driver not in ["chrome", "firefox", "edge", "opera", "safari"]:
         raise Exception("Webdriver must be one of: Chrome, Firefox, Edge, Opera, Safari")
 
+    if workers < 1:
+        raise Exception("Number of workers must be at least 1")
+
+    if static and take_screenshots:
+        raise Exception("Screenshots can not be taken in static mode")
+
     accessibility_tester = AccessibilityTester(url, required_degree, driver, run_headless, take_screenshots,
-                                               browser_height, browser_width, should_follow)
+                                               browser_height, browser_width, should_follow, workers, static)
 
     accessibility_tester.start_driver()
 
     accessibility_tester.test_page()
 
-    accessibility_tester.driver.quit()
+    # no webdriver is started in static mode
+    if not accessibility_tester.driver is None:
+        accessibility_tester.driver.quit()
 
     accessibility_tester.calculate_result()
 